@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -26,6 +27,8 @@ SECRET_KEY = os.environ.get("SECRET_KEY", "changeme")
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = bool(int(os.environ.get("DEBUG", 0)))
 
+TESTING = sys.argv[1:2] == ["test"] or "pytest" in sys.modules
+
 ALLOWED_HOSTS = []
 ALLOWED_HOSTS.extend(
     filter(None, os.environ.get("ALLOWED_HOSTS", "").split(","))
@@ -93,6 +96,28 @@ DATABASES = {
     }
 }
 
+# Tests tagged "unit" don't depend on Postgres and can run against an
+# in-memory SQLite database: UNIT_TEST_SQLITE=1 manage.py test --tag=unit
+if TESTING and bool(int(os.environ.get("UNIT_TEST_SQLITE", 0))):
+    DATABASES["default"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+}
+
+if os.environ.get("REDIS_URL") and not TESTING:
+    CACHES["default"] = {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": os.environ.get("REDIS_URL"),
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -113,6 +138,11 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing is irrelevant to the test suite, so use a cheap hasher
+if TESTING:
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/3.2/topics/i18n/
 
@@ -2,11 +2,12 @@
 Sample tests
 """
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, tag
 
 from . import calc
 
 
+@tag("unit")
 class CalcTests(SimpleTestCase):
     """
     Test the calc module
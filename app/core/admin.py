@@ -1,3 +1,4 @@
+from django import forms
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
@@ -37,6 +38,30 @@ class UserAdmin(BaseUserAdmin):
     )
 
 
+class IngredientAdminForm(forms.ModelForm):
+    class Meta:
+        model = models.Ingredient
+        fields = "__all__"
+
+    def clean(self):
+        cleaned_data = super().clean()
+        user = cleaned_data.get("user")
+        name = cleaned_data.get("name")
+        duplicates = models.Ingredient.objects.filter(
+            user=user, name=name
+        ).exclude(pk=self.instance.pk)
+        if user and name and duplicates.exists():
+            raise forms.ValidationError(
+                _("This user already has an ingredient with this name.")
+            )
+
+        return cleaned_data
+
+
+class IngredientAdmin(admin.ModelAdmin):
+    form = IngredientAdminForm
+
+
 admin.site.register(models.User, UserAdmin)
 admin.site.register(models.Recipe)
-admin.site.register(models.Ingredient)
+admin.site.register(models.Ingredient, IngredientAdmin)
@@ -0,0 +1,41 @@
+"""
+Authentication classes
+"""
+
+from functools import lru_cache
+import copy
+import time
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+TOKEN_CACHE_TTL = 60
+
+
+@lru_cache(maxsize=10_000)
+def _cached_credentials(key, ttl_bucket):
+    return TokenAuthentication().authenticate_credentials(key)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication caching token lookups for TOKEN_CACHE_TTL.
+
+    Each request gets its own copy of the cached user and token, so
+    changes to request.user never leak into other requests.
+    """
+
+    def authenticate_credentials(self, key):
+        ttl_bucket = int(time.monotonic() // TOKEN_CACHE_TTL)
+        user, token = _cached_credentials(key, ttl_bucket)
+        user, token = copy.copy(user), copy.copy(token)
+        token.user = user
+        return user, token
+
+
+@receiver(post_delete, sender=Token)
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def _clear_cached_credentials(sender, **kwargs):
+    _cached_credentials.cache_clear()
@@ -0,0 +1,50 @@
+# Generated by Django 3.2.25 on 2026-10-15 11:38
+
+from django.db import migrations
+from django.db.models import Count, Min
+
+
+def merge_duplicate_ingredients(apps, schema_editor):
+    Ingredient = apps.get_model('core', 'Ingredient')
+    RecipeIngredient = apps.get_model('core', 'Recipe').ingredients.through
+
+    duplicates = (
+        Ingredient.objects.values('user_id', 'name')
+        .annotate(keep_id=Min('id'), total=Count('id'))
+        .filter(total__gt=1)
+    )
+    for duplicate in duplicates:
+        keep_id = duplicate['keep_id']
+        merged = Ingredient.objects.filter(
+            user_id=duplicate['user_id'], name=duplicate['name']
+        ).exclude(id=keep_id)
+
+        linked = set(
+            RecipeIngredient.objects.filter(
+                ingredient_id=keep_id
+            ).values_list('recipe_id', flat=True)
+        )
+        for link in RecipeIngredient.objects.filter(
+            ingredient__in=merged
+        ).order_by('id'):
+            if link.recipe_id in linked:
+                link.delete()
+            else:
+                link.ingredient_id = keep_id
+                link.save()
+                linked.add(link.recipe_id)
+
+        merged.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_recipe_image'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            merge_duplicate_ingredients, migrations.RunPython.noop
+        ),
+    ]
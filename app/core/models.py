@@ -11,14 +11,13 @@ from django.contrib.auth.models import (
 )
 
 import uuid
-import os
 
 
 def recipe_image_file_path(instance, filename):
-    ext = os.path.splitext(filename)[1]
-    filename = f"{uuid.uuid4()}{ext}"
+    head, sep, ext = filename.rpartition(".")
+    ext = ext if sep and head else "jpg"
 
-    return os.path.join("uploads", "recipe", filename)
+    return f"uploads/recipe/{uuid.uuid4()}.{ext}"
 
 
 class UserManager(BaseUserManager):
@@ -70,6 +69,13 @@ class Recipe(models.Model):
     ingredients = models.ManyToManyField("Ingredient")
     image = models.ImageField(null=True, upload_to=recipe_image_file_path)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "-id"], name="recipe_user_id_desc_idx"
+            )
+        ]
+
     def __str__(self):
         return self.title
 
@@ -80,5 +86,12 @@ class Ingredient(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "name"], name="unique_ingredient_per_user"
+            )
+        ]
+
     def __str__(self):
         return self.name
@@ -1,9 +1,12 @@
-from django.test import TestCase
+from django.test import TestCase, tag
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.test import Client
 
+from core.models import Ingredient
 
+
+@tag("integration")
 class AdminSiteTests(TestCase):
     def setUp(self):
         self.client = Client()
@@ -34,3 +37,14 @@ class AdminSiteTests(TestCase):
         res = self.client.get(url)
 
         self.assertEquals(res.status_code, 200)
+
+    def test_edit_ingredient_duplicate_name_rejected(self):
+        Ingredient.objects.create(user=self.user, name="Salt")
+        ingredient = Ingredient.objects.create(user=self.user, name="Pepper")
+
+        url = reverse("admin:core_ingredient_change", args=[ingredient.id])
+        res = self.client.post(url, {"user": self.user.id, "name": "Salt"})
+
+        self.assertEqual(res.status_code, 200)
+        ingredient.refresh_from_db()
+        self.assertEqual(ingredient.name, "Pepper")
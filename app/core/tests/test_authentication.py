@@ -0,0 +1,78 @@
+"""
+Tests for authentication
+"""
+
+from unittest.mock import patch
+
+from django.test import TestCase, tag
+from django.contrib.auth import get_user_model
+
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+from core.authentication import CachedTokenAuthentication, TOKEN_CACHE_TTL
+
+
+@tag("unit")
+class CachedTokenAuthenticationTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            "user@example.com", "testpass123"
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+        patcher = patch("core.authentication.time.monotonic")
+        self.monotonic = patcher.start()
+        self.monotonic.return_value = 1000.0
+        self.addCleanup(patcher.stop)
+
+    def test_token_lookup_cached(self):
+        user, token = self.auth.authenticate_credentials(self.token.key)
+
+        with self.assertNumQueries(0):
+            cached_user, cached_token = self.auth.authenticate_credentials(
+                self.token.key
+            )
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(cached_user, self.user)
+        self.assertEqual(cached_token, token)
+
+    def test_token_lookup_expires_after_ttl(self):
+        self.auth.authenticate_credentials(self.token.key)
+
+        self.monotonic.return_value += TOKEN_CACHE_TTL
+        with self.assertNumQueries(1):
+            user, _ = self.auth.authenticate_credentials(self.token.key)
+
+        self.assertEqual(user, self.user)
+
+    def test_cached_user_not_shared_between_requests(self):
+        user, _ = self.auth.authenticate_credentials(self.token.key)
+        user.name = "Changed"
+
+        cached_user, cached_token = self.auth.authenticate_credentials(
+            self.token.key
+        )
+
+        self.assertIsNot(cached_user, user)
+        self.assertIs(cached_token.user, cached_user)
+        self.assertEqual(cached_user.name, "")
+
+    def test_deleted_token_rejected(self):
+        self.auth.authenticate_credentials(self.token.key)
+
+        self.token.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    def test_inactive_user_rejected(self):
+        self.auth.authenticate_credentials(self.token.key)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
@@ -4,9 +4,10 @@ from psycopg2 import OperationalError as Psycopg2Error
 
 from django.core.management import call_command
 from django.db.utils import OperationalError
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, tag
 
 
+@tag("unit")
 @patch("core.management.commands.wait_for_db.Command.check")
 class CommandTests(SimpleTestCase):
 
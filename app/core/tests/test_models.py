@@ -5,24 +5,27 @@ Tests for Models
 from unittest.mock import patch
 from decimal import Decimal
 
-from django.test import TestCase
+from django.test import TestCase, tag
 from django.contrib.auth import get_user_model
 from django.contrib.auth.base_user import AbstractBaseUser
 
 from core import models
 
+User = get_user_model()
+
 
 def create_user(email="user@example.com", password="testpass123"):
-    return get_user_model().objects.create_user(email, password)
+    return User.objects.create_user(email, password)
 
 
+@tag("unit")
 class ModelTests(TestCase):
     """Test models."""
 
     def test_create_user_with_email_succesful(self):
         email = "test@example.com"
         password = "testpass123"
-        user: AbstractBaseUser = get_user_model().objects.create_user(
+        user: AbstractBaseUser = User.objects.create_user(
             email=email, password=password
         )
 
@@ -39,25 +42,21 @@ class ModelTests(TestCase):
         ]
 
         for email, expected in sample_emails:
-            user = get_user_model().objects.create_user(email, "sample123")
+            user = User.objects.create_user(email, "sample123")
             self.assertEqual(user.email, expected)
 
     def test_new_user_without_email_raises_error(self):
         with self.assertRaises(ValueError):
-            get_user_model().objects.create_user("", "test123")
+            User.objects.create_user("", "test123")
 
     def test_create_super_user(self):
-        user = get_user_model().objects.create_superuser(
-            "test@example.com", "test123"
-        )
+        user = User.objects.create_superuser("test@example.com", "test123")
 
         self.assertTrue(user.is_superuser)
         self.assertTrue(user.is_staff)
 
     def test_create_recipe(self):
-        user = get_user_model().objects.create_superuser(
-            "test@example.com", "test123"
-        )
+        user = User.objects.create_superuser("test@example.com", "test123")
 
         recipe = models.Recipe.objects.create(
             user=user,
@@ -85,3 +84,14 @@ class ModelTests(TestCase):
 
         expected_path = f"uploads/recipe/{uuid}.jpg"
         self.assertEqual(file_path, expected_path)
+
+    @patch("core.models.uuid.uuid4")
+    def test_recipe_file_name_without_extension(self, mock_uuid):
+        uuid = "test-uuid"
+        mock_uuid.return_value = uuid
+
+        file_path = models.recipe_image_file_path(None, "example")
+        dotfile_path = models.recipe_image_file_path(None, ".bashrc")
+
+        self.assertEqual(file_path, f"uploads/recipe/{uuid}.jpg")
+        self.assertEqual(dotfile_path, f"uploads/recipe/{uuid}.jpg")
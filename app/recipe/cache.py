@@ -0,0 +1,47 @@
+"""
+Per-user caching of the recipe list
+"""
+
+import hashlib
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import Recipe, Ingredient
+
+RECIPE_LIST_CACHE_TIMEOUT = 300
+
+
+def _version_key(user_id):
+    return f"recipes:{user_id}:version"
+
+
+def recipe_list_cache_key(user_id, url):
+    """Return the cache key for a user's recipe list at its current version.
+
+    The key covers the absolute request URL because cached pages embed
+    absolute next/previous links built from the request's scheme and host.
+    """
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(_version_key(user_id), version, None)
+
+    url_hash = hashlib.sha256(url.encode()).hexdigest()
+    return f"recipes:{user_id}:{version}:{url_hash}"
+
+
+def invalidate_recipe_list(user_id):
+    """Orphan every cached recipe list page for the user."""
+    cache.delete(_version_key(user_id))
+
+
+@receiver([post_save, post_delete], sender=Recipe)
+@receiver([post_save, post_delete], sender=Ingredient)
+@receiver(m2m_changed, sender=Recipe.ingredients.through)
+def _invalidate_on_write(sender, instance, **kwargs):
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_recipe_list(user_id))
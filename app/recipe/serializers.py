@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from rest_framework import serializers
 
 from core.models import Recipe, Ingredient
@@ -9,6 +11,20 @@ class IngredientSerializer(serializers.ModelSerializer):
         fields = ["id", "name"]
         read_only_fields = ["id"]
 
+    def validate_name(self, value):
+        if self.instance is None:
+            return value
+
+        duplicates = Ingredient.objects.filter(
+            user=self.instance.user, name=value
+        ).exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError(
+                "An ingredient with this name already exists."
+            )
+
+        return value
+
 
 class RecipeSerializer(serializers.ModelSerializer):
     ingredients = IngredientSerializer(many=True, required=False)
@@ -27,11 +43,20 @@ class RecipeSerializer(serializers.ModelSerializer):
 
     def _get_or_create_ingredients(self, ingredients, recipe):
         auth_user = self.context["request"].user
-        for ingredient in ingredients:
-            ingredient_obj, create = Ingredient.objects.get_or_create(
-                user=auth_user, **ingredient
-            )
-            recipe.ingredients.add(ingredient_obj)
+        names = {ingredient["name"] for ingredient in ingredients}
+        user_ingredients = Ingredient.objects.filter(
+            user=auth_user, name__in=names
+        )
+
+        existing = set(user_ingredients.values_list("name", flat=True))
+        Ingredient.objects.bulk_create(
+            [
+                Ingredient(user=auth_user, name=name)
+                for name in names - existing
+            ],
+            ignore_conflicts=True,
+        )
+        recipe.ingredients.set(user_ingredients)
 
     def create(self, validated_data):
         ingredients = validated_data.pop("ingredients", [])
@@ -44,7 +69,6 @@ class RecipeSerializer(serializers.ModelSerializer):
         ingredients = validated_data.pop("ingredients", None)
 
         if ingredients is not None:
-            instance.ingredients.clear()
             self._get_or_create_ingredients(ingredients, instance)
 
         for attr, value in validated_data.items():
@@ -54,6 +78,43 @@ class RecipeSerializer(serializers.ModelSerializer):
         return instance
 
 
+class RecipeRowListSerializer(serializers.ListSerializer):
+    """Attach ingredients to recipe rows with a single query."""
+
+    def to_representation(self, data):
+        rows = list(data)
+        ingredients = defaultdict(list)
+        recipe_ingredients = Recipe.ingredients.through.objects.filter(
+            recipe_id__in=[row["id"] for row in rows]
+        ).values_list("recipe_id", "ingredient__id", "ingredient__name")
+        for recipe_id, ingredient_id, name in recipe_ingredients:
+            ingredients[recipe_id].append({"id": ingredient_id, "name": name})
+
+        return [
+            self.child.to_representation(
+                {**row, "ingredients": ingredients[row["id"]]}
+            )
+            for row in rows
+        ]
+
+
+class RecipeListSerializer(RecipeSerializer):
+    """Read-only recipe serializer for rows from Recipe.objects.values()."""
+
+    class Meta(RecipeSerializer.Meta):
+        list_serializer_class = RecipeRowListSerializer
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "title": row["title"],
+            "time_minutes": row["time_minutes"],
+            "price": self.fields["price"].to_representation(row["price"]),
+            "link": row["link"],
+            "ingredients": row["ingredients"],
+        }
+
+
 class RecipeDetailSerializer(RecipeSerializer):
     class Meta(RecipeSerializer.Meta):
         fields = RecipeSerializer.Meta.fields + ["description", "image"]
@@ -1,6 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import TestCase, tag
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -20,6 +20,7 @@ def create_user(email="user@example.com", password="testpas123"):
     return get_user_model().objects.create_user(email, password)
 
 
+@tag("integration")
 class PublicIngredientsApiTests(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -29,6 +30,7 @@ class PublicIngredientsApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@tag("integration")
 class PrivateIngredientsApiTests(TestCase):
     def setUp(self):
         self.user = create_user()
@@ -71,6 +73,19 @@ class PrivateIngredientsApiTests(TestCase):
         ingredient.refresh_from_db()
         self.assertEqual(ingredient.name, payload.get("name"))
 
+    def test_update_ingredient_duplicate_name_bad_request(self):
+        Ingredient.objects.create(user=self.user, name="Salt")
+        ingredient = Ingredient.objects.create(user=self.user, name="Pepper")
+
+        payload = {"name": "Salt"}
+        url = detail_url(ingredient.id)
+
+        res = self.client.patch(url, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        ingredient.refresh_from_db()
+        self.assertEqual(ingredient.name, "Pepper")
+
     def test_delete_ingredient(self):
         ingredient = Ingredient.objects.create(user=self.user, name="Lettuce")
 
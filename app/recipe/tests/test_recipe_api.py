@@ -1,6 +1,7 @@
 from decimal import Decimal
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings, tag
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
@@ -9,15 +10,31 @@ from rest_framework.test import APIClient
 
 from core.models import Recipe, Ingredient
 
-from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
+from recipe.serializers import (
+    RecipeSerializer,
+    RecipeDetailSerializer,
+    RecipeListSerializer,
+)
 import tempfile
 import os
+from io import BytesIO
 from PIL import Image
 
+User = get_user_model()
+
 
 RECIPES_URL = reverse("recipe:recipe-list")
 
 
+def _build_jpeg_bytes():
+    buffer = BytesIO()
+    Image.new("RGB", (10, 10)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+JPEG_BYTES = _build_jpeg_bytes()
+
+
 def detail_url(recipe_id):
     return reverse("recipe:recipe-detail", args=[recipe_id])
 
@@ -42,6 +59,7 @@ def create_recipe(user, **params):
     return recipe
 
 
+@tag("integration")
 class PublicRecipeAPITests(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -50,13 +68,14 @@ class PublicRecipeAPITests(TestCase):
         self.assertEquals(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@tag("integration")
 class PrivateRecipeApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("user@example.com", "testpass123")
+
     def setUp(self):
         self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
-            "user@example.com", "testpass123"
-        )
-
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes(self):
@@ -69,10 +88,35 @@ class PrivateRecipeApiTests(TestCase):
         serializer = RecipeSerializer(recipes, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data["results"], serializer.data)
+
+    def test_retrieve_recipes_query_count(self):
+        ingredient = Ingredient.objects.create(user=self.user, name="Salt")
+        for _ in range(3):
+            recipe = create_recipe(user=self.user)
+            recipe.ingredients.add(ingredient)
+
+        with self.assertNumQueries(2):
+            res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["results"]), 3)
+
+    def test_list_serializer_matches_recipe_serializer(self):
+        ingredient = Ingredient.objects.create(user=self.user, name="Basil")
+        recipe = create_recipe(user=self.user, price=Decimal("4.5"))
+        recipe.ingredients.add(ingredient)
+        rows = Recipe.objects.filter(id=recipe.id).values(
+            "id", "title", "time_minutes", "price", "link"
+        )
+
+        self.assertEqual(
+            RecipeListSerializer(rows, many=True).data,
+            RecipeSerializer([recipe], many=True).data,
+        )
 
     def test_recipe_list_limited_to_user(self):
-        other_user = get_user_model().objects.create_user(
+        other_user = User.objects.create_user(
             "other@examle.com", "testpass123"
         )
 
@@ -81,11 +125,11 @@ class PrivateRecipeApiTests(TestCase):
 
         res = self.client.get(RECIPES_URL)
 
-        recipes = Recipe.objects.filter(user=self.user)
+        recipes = Recipe.objects.filter(user=self.user).order_by("-id")
         serializer = RecipeSerializer(recipes, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data["results"], serializer.data)
 
     def test_get_recipe_detail(self):
         recipe = create_recipe(user=self.user)
@@ -163,6 +207,27 @@ class PrivateRecipeApiTests(TestCase):
             ).exists()
             self.assertTrue(exists)
 
+    def test_create_recipe_with_duplicate_ingredients(self):
+        payload = {
+            "title": "Guacamole",
+            "time_minutes": 10,
+            "price": "3.10",
+            "ingredients": [
+                {"name": "Avocado"},
+                {"name": "Avocado"},
+            ],
+        }
+
+        res = self.client.post(RECIPES_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipe = Recipe.objects.get(id=res.data["id"])
+        self.assertEqual(recipe.ingredients.count(), 1)
+        self.assertEqual(
+            Ingredient.objects.filter(user=self.user, name="Avocado").count(),
+            1,
+        )
+
     def test_create_ingredient_on_update(self):
         recipe = create_recipe(user=self.user)
 
@@ -228,18 +293,132 @@ class PrivateRecipeApiTests(TestCase):
 
         res = self.client.get(RECIPES_URL, params)
 
-        self.assertIn(serialized1.data, res.data)
-        self.assertIn(serialized2.data, res.data)
-        self.assertNotIn(serialized3.data, res.data)
+        self.assertIn(serialized1.data, res.data["results"])
+        self.assertIn(serialized2.data, res.data["results"])
+        self.assertNotIn(serialized3.data, res.data["results"])
 
+    def test_filter_by_ingredients_returns_unique_recipes(self):
+        recipe = create_recipe(user=self.user, title="Stew")
 
-class ImageUploadTests(TestCase):
+        ingredient1 = Ingredient.objects.create(user=self.user, name="Onion")
+        ingredient2 = Ingredient.objects.create(user=self.user, name="Carrot")
+        recipe.ingredients.add(ingredient1, ingredient2)
+
+        params = {"ingredients": f"{ingredient1.id},{ingredient2.id}"}
+
+        res = self.client.get(RECIPES_URL, params)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["results"]), 1)
+
+    def test_filter_by_invalid_ingredients_bad_request(self):
+        params = {"ingredients": "1,abc"}
+
+        res = self.client.get(RECIPES_URL, params)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_filter_by_oversized_ingredient_id_bad_request(self):
+        for ingredient_id in ["1" * 19, "1" * 5000, "\u0661"]:
+            res = self.client.get(RECIPES_URL, {"ingredients": ingredient_id})
+
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@tag("integration")
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+)
+class RecipeListCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("user@example.com", "testpass123")
 
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+        self.client.force_authenticate(self.user)
+
+    def test_recipe_list_served_from_cache(self):
+        create_recipe(user=self.user)
+        self.client.get(RECIPES_URL)
+
+        with self.assertNumQueries(0):
+            res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["results"]), 1)
+
+    def test_recipe_list_cache_invalidated_on_write(self):
+        recipe = create_recipe(user=self.user)
+        self.client.get(RECIPES_URL)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ingredient = Ingredient.objects.create(user=self.user, name="Mint")
+            recipe.ingredients.add(ingredient)
+            create_recipe(user=self.user, title="Second recipe")
+        res = self.client.get(RECIPES_URL)
+
+        recipes = Recipe.objects.filter(user=self.user).order_by("-id")
+        serializer = RecipeSerializer(recipes, many=True)
+        self.assertEqual(res.data["results"], serializer.data)
+
+    def test_recipe_list_cache_kept_until_commit(self):
+        create_recipe(user=self.user)
+        self.client.get(RECIPES_URL)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            create_recipe(user=self.user, title="Second recipe")
+            res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(len(res.data["results"]), 1)
+        for callback in callbacks:
+            callback()
+        res = self.client.get(RECIPES_URL)
+        self.assertEqual(len(res.data["results"]), 2)
+
+    @override_settings(ALLOWED_HOSTS=["api.example.com", "testserver"])
+    def test_recipe_list_cached_per_host_and_scheme(self):
+        Recipe.objects.bulk_create(
+            Recipe(user=self.user, title="Recipe", time_minutes=5, price=1)
+            for _ in range(26)
+        )
+        self.client.get(RECIPES_URL)
+
+        res = self.client.get(
+            RECIPES_URL, HTTP_HOST="api.example.com", secure=True
+        )
+
+        self.assertTrue(
+            res.data["next"].startswith("https://api.example.com/")
+        )
+
+    def test_recipe_list_cached_per_user(self):
+        other_user = User.objects.create_user(
+            "other@example.com", "testpass123"
+        )
+        create_recipe(user=other_user)
+        self.client.get(RECIPES_URL)
+
+        other_client = APIClient()
+        other_client.force_authenticate(other_user)
+        res = other_client.get(RECIPES_URL)
+
+        self.assertEqual(len(res.data["results"]), 1)
+
+
+@tag("integration")
+class ImageUploadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="user@example.com", password="testpass123"
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
         self.recipe = create_recipe(user=self.user)
 
@@ -249,8 +428,7 @@ class ImageUploadTests(TestCase):
     def test_upload_image(self):
         url = image_upload_url(self.recipe.id)
         with tempfile.NamedTemporaryFile(suffix=".jpg") as image_file:
-            img = Image.new("RGB", (10, 10))
-            img.save(image_file, format="JPEG")
+            image_file.write(JPEG_BYTES)
             image_file.seek(0)
             payload = {"image": image_file}
             res = self.client.post(url, payload, format="multipart")
@@ -1,17 +1,37 @@
+from functools import lru_cache
+import re
+
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
     OpenApiParameter,
     OpenApiTypes,
 )
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
 from rest_framework import viewsets, mixins, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 
+from core.authentication import CachedTokenAuthentication
 from core.models import Recipe, Ingredient
 from recipe import serializers
+from recipe.cache import RECIPE_LIST_CACHE_TIMEOUT, recipe_list_cache_key
+
+IDS_PARAM_RE = re.compile(r"[0-9]{1,18}(,[0-9]{1,18})*")
+
+
+@lru_cache(maxsize=1024)
+def _parse_ids(qs: str) -> tuple[int, ...]:
+    return tuple(int(str_id) for str_id in qs.split(","))
+
+
+class RecipePagination(CursorPagination):
+    page_size = 25
+    ordering = "-id"
 
 
 @extend_schema_view(
@@ -28,30 +48,53 @@ from recipe import serializers
 class RecipeViewSet(viewsets.ModelViewSet):
     serializer_class = serializers.RecipeDetailSerializer
     queryset = Recipe.objects.all()
-    authentication_classes = (TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication,)
     permission_classes = (IsAuthenticated,)
+    pagination_class = RecipePagination
 
     def _params_to_ints(self, qs):
-        return [int(str_id) for str_id in qs.split(",")]
+        if not IDS_PARAM_RE.fullmatch(qs):
+            raise ValidationError(
+                {"ingredients": "Expected a comma separated list of IDs."}
+            )
+        return list(_parse_ids(qs))
 
     def get_queryset(self):
         ingredients = self.request.query_params.get("ingredients")
-        queryset = self.queryset
+        queryset = Recipe.objects.filter(user=self.request.user)
         if ingredients:
             ingredient_ids = self._params_to_ints(ingredients)
-            queryset = queryset.filter(ingredients__id__in=ingredient_ids)
-        return (
-            queryset.filter(user=self.request.user).order_by("-id").distinct()
-        )
+            recipe_ingredients = Recipe.ingredients.through.objects.filter(
+                recipe_id=OuterRef("pk"), ingredient_id__in=ingredient_ids
+            )
+            queryset = queryset.filter(Exists(recipe_ingredients))
+        if self.action == "list":
+            return queryset.values(
+                "id", "title", "time_minutes", "price", "link"
+            )
+        if self.action == "upload_image":
+            return queryset
+        return queryset.prefetch_related("ingredients")
 
     def get_serializer_class(self):
         if self.action == "list":
-            return serializers.RecipeSerializer
+            return serializers.RecipeListSerializer
         elif self.action == "upload_image":
             return serializers.RecipeImageSerializer
 
         return self.serializer_class
 
+    def list(self, request, *args, **kwargs):
+        key = recipe_list_cache_key(
+            request.user.id, request.build_absolute_uri()
+        )
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, RECIPE_LIST_CACHE_TIMEOUT)
+
+        return Response(data)
+
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
@@ -74,8 +117,10 @@ class IngredientViewSet(
 ):
     serializer_class = serializers.IngredientSerializer
     queryset = Ingredient.objects.all()
-    authentication_classes = (TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication,)
     permission_classes = (IsAuthenticated,)
 
     def get_queryset(self):
-        return self.queryset.filter(user=self.request.user).order_by("-name")
+        return Ingredient.objects.filter(user=self.request.user).order_by(
+            "-name"
+        )
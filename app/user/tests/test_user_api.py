@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, tag
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
@@ -16,6 +16,7 @@ def create_user(**params):
     return get_user_model().objects.create_user(**params)
 
 
+@tag("integration")
 class PublicUserApiTests(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -104,6 +105,7 @@ class PublicUserApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@tag("integration")
 class PrivateUserApiTests(TestCase):
     def setUp(self):
         self.user: User = create_user(